@@ -1,4 +1,4 @@
-import pandas as pd
+import csv
 from pathlib import Path
 
 # Define paths
@@ -8,22 +8,34 @@ output_dir = Path("/Users/user/programming/manifestos_and_identity/2a_text_outpu
 # Create output directory if it doesn't exist
 output_dir.mkdir(parents=True, exist_ok=True)
 
+# Cells pandas.read_csv reads as missing, which the old dropna() skipped
+NA_VALUES = {
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+}
+
 # Process each CSV file in the source directory
 for csv_file in source_dir.glob("*.csv"):
     try:
-        df = pd.read_csv(csv_file)
-        text_data = df["text"].dropna().astype(str).tolist()
-
-        # Combine all text chunks into one string, each followed by a newline
-        combined_text = "\n".join(text_data)
-
         # Construct the output file name
         new_name = csv_file.stem + "_from_csv.txt"
         output_path = output_dir / new_name
 
-        # Write to the output file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(combined_text)
+        # Stream the text column straight to the output file, one chunk per line
+        with open(csv_file, newline="", encoding="utf-8-sig") as src:
+            reader = csv.DictReader(src)
+            if reader.fieldnames is None or "text" not in reader.fieldnames:
+                raise KeyError("text")
+
+            with open(output_path, "w", encoding="utf-8") as f:
+                separator = ""
+                for row in reader:
+                    text = row["text"]
+                    if text is None or text in NA_VALUES:
+                        continue
+                    f.write(separator)
+                    f.write(text)
+                    separator = "\n"
 
         print(f"Processed: {csv_file.name} -> {new_name}")
     except Exception as e:
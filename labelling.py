@@ -1,11 +1,18 @@
+import asyncio
+import json
+import os
 import pandas as pd
 import time
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
 
 # Initialize OpenAI client
-client = OpenAI(api_key="")
+client = AsyncOpenAI(api_key="")
+
+# Extra attempts for a request that is still rate limited (HTTP 429) after the
+# client's own retries; the wait doubles each time from rate_limit_backoff seconds
+rate_limit_retries = 5
+rate_limit_backoff = 2
 
 # Define constructs and their definitions
 constructs = {
@@ -24,46 +31,109 @@ Does this text express {construct}?
 Respond only with yes or no.
 Text: {chunk_text}"""}]
 
-def call_openai(row_index, construct, definition, chunk_text):
-    try:
+async def call_openai(semaphore, row_index, construct, definition, chunk_text):
+    async with semaphore:
         messages = build_messages(construct, definition, chunk_text)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=messages,
-            temperature=0
-        )
-        result = extract_yes_no(response.choices[0].message.content)
-        return row_index, result
-    except Exception as e:
-        print(f"Error on row {row_index}: {e}")
-        return row_index, None
-
-def process_construct_parallel(df, construct, definition, output_file, max_workers=5):
-    if construct not in df.columns:
-        df[construct] = None
-
-    print(f"\n⏳ Processing '{construct}'...")
-    rows_to_process = df[df[construct].isna()]
+        for attempt in range(rate_limit_retries + 1):
+            try:
+                response = await client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=messages,
+                    temperature=0,
+                    # The answer is a single "Yes"/"No" token; don't pay for more.
+                    max_tokens=1
+                )
+                result = extract_yes_no(response.choices[0].message.content)
+                return row_index, result
+            except RateLimitError as e:
+                if attempt == rate_limit_retries:
+                    print(f"Error on row {row_index}: {e}")
+                    return row_index, None
+                # Hold the semaphore while waiting so the whole pool slows down
+                await asyncio.sleep(rate_limit_backoff * 2 ** attempt)
+            except Exception as e:
+                print(f"Error on row {row_index}: {e}")
+                return row_index, None
+
+def _store_results(df, construct, indices, results):
+    """Write the buffered labels into df in one assignment and clear the buffers."""
+    if indices:
+        df.loc[indices, construct] = results
+        indices.clear()
+        results.clear()
+
+def _checkpoint_path(output_file, construct):
+    """Sidecar JSONL holding labels finished since output_file was last written."""
+    return f"{output_file}.{construct.lower().replace(' ', '_')}.partial.jsonl"
+
+def _load_checkpoint(df, construct, checkpoint_file):
+    """Fill in labels saved by an interrupted run (row indices refer to the same input CSV)."""
+    if not os.path.exists(checkpoint_file):
+        return
+    indices, results = [], []
+    with open(checkpoint_file, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short when the previous run was killed
+            indices.append(record["index"])
+            results.append(record["label"])
+    print(f"↩️ Resuming with {len(indices)} labels from {checkpoint_file}")
+    _store_results(df, construct, indices, results)
+
+async def _label_rows(df, construct, definition, checkpoint_file, max_concurrent):
+    pending = df[construct].isna().to_numpy()
+    rows_to_process = zip(df.index[pending], df["chunk_text"].values[pending])
     save_interval = 1000
     call_counter = 0
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(call_openai, i, construct, definition, row["chunk_text"]): i
-            for i, row in rows_to_process.iterrows()
-        }
-
-        for future in tqdm(as_completed(futures), total=len(futures)):
-            idx, result = future.result()
-            df.at[idx, construct] = result
+    done_indices = []
+    done_results = []
+
+    # Each call is network-bound, so keep many requests in flight on one
+    # event loop instead of a handful of blocking threads.
+    semaphore = asyncio.Semaphore(max_concurrent)
+    tasks = [
+        asyncio.create_task(call_openai(semaphore, i, construct, definition, chunk_text))
+        for i, chunk_text in rows_to_process
+    ]
+
+    # Checkpoint by appending each label to a sidecar file rather than
+    # rewriting the whole CSV every save_interval calls.
+    with open(checkpoint_file, "a", encoding="utf-8") as checkpoint:
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks)):
+            idx, result = await task
+            done_indices.append(idx)
+            done_results.append(result)
             call_counter += 1
+            # Failed calls are left out so a resumed run retries them
+            if result is not None:
+                checkpoint.write(json.dumps({"index": int(idx), "label": result}) + "\n")
 
             if call_counter % save_interval == 0:
                 print(f"💾 Saving after {call_counter} calls...")
-                df.to_csv(output_file, index=False)
+                checkpoint.flush()
+                _store_results(df, construct, done_indices, done_results)
+
+    _store_results(df, construct, done_indices, done_results)
+
+def process_construct_parallel(df, construct, definition, output_file, max_concurrent=16):
+    if construct not in df.columns:
+        df[construct] = None
+
+    checkpoint_file = _checkpoint_path(output_file, construct)
+    _load_checkpoint(df, construct, checkpoint_file)
+
+    print(f"\n⏳ Processing '{construct}'...")
+    asyncio.run(_label_rows(df, construct, definition, checkpoint_file, max_concurrent))
 
     print(f"✅ Finished '{construct}'. Saving final result...")
+    unlabelled = int(df[construct].isna().sum())
+    if unlabelled:
+        print(f"⚠️ {unlabelled} rows are still unlabelled; re-run to retry them")
     df.to_csv(output_file, index=False)
+    # Every saved label is now in output_file
+    os.remove(checkpoint_file)
     return df
 
 # --- Main Script ---
@@ -80,5 +150,4 @@ df = pd.read_csv(input_file)
 if selected_construct not in constructs:
     raise ValueError(f"'{selected_construct}' is not a valid construct. Choose from: {list(constructs.keys())}")
 
-df = process_construct_parallel(df, selected_construct, constructs[selected_construct], output_file, max_workers=4)
-df.to_csv(output_file, index=False)
\ No newline at end of file
+df = process_construct_parallel(df, selected_construct, constructs[selected_construct], output_file, max_concurrent=16)
\ No newline at end of file
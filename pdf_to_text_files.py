@@ -1,6 +1,6 @@
 import os
-import io
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import fitz  # PyMuPDF
 from PIL import Image
@@ -26,9 +26,14 @@ def extract_text_with_pymupdf(pdf_path: str, output_txt_path: str):
     print(f"PyMuPDF extraction complete. Saved to: {output_txt_path}")
 
 
-def extract_text_with_ocr(pdf_path: str, output_txt_path: str, dpi: int = 300):
-    """Extract text using Tesseract OCR."""
-    print(f"Starting Tesseract OCR extraction for: {os.path.basename(pdf_path)}")
+def _limit_tesseract_threads():
+    """Worker initializer: keep each Tesseract subprocess single-threaded."""
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _ocr_page(args):
+    """OCR a single PDF page. Returns (text, error message) with one of them None."""
+    pdf_path, page_index, dpi = args
     
     # Optional: Set the Tesseract binary path if needed (for Apple Silicon)
     try:
@@ -36,38 +41,64 @@ def extract_text_with_ocr(pdf_path: str, output_txt_path: str, dpi: int = 300):
     except:
         pass  # Use system default if path doesn't exist
     
-    doc = fitz.open(pdf_path)
+    try:
+        with fitz.open(pdf_path) as doc:
+            # Convert page to high-resolution image
+            pix = doc[page_index].get_pixmap(dpi=dpi)
+        # Hand the raw samples to PIL rather than round-tripping through PNG
+        mode = "RGBA" if pix.alpha else "RGB"
+        image = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+        
+        # Apply OCR with better configuration
+        custom_config = r'--oem 3 --psm 6 -c preserve_interword_spaces=1'
+        return pytesseract.image_to_string(image, config=custom_config), None
+    except Exception as e:
+        # Return the message rather than the exception, which may not pickle
+        return None, str(e)
+
+
+def extract_text_with_ocr(pdf_path: str, output_txt_path: str, dpi: int = 300, max_workers: int = None):
+    """Extract text using Tesseract OCR, running pages in parallel worker processes.
     
-    with open(output_txt_path, 'w', encoding='utf-8') as out_file:
-        for page_number, page in enumerate(doc, start=1):
-            print(f"  Processing page {page_number}/{len(doc)} with OCR...")
-            
-            try:
-                # Convert page to high-resolution image
-                pix = page.get_pixmap(dpi=dpi)
-                img_bytes = pix.tobytes("png")
-                image = Image.open(io.BytesIO(img_bytes))
-                
-                # Apply OCR with better configuration
-                custom_config = r'--oem 3 --psm 6 -c preserve_interword_spaces=1'
-                text = pytesseract.image_to_string(image, config=custom_config)
-                
+    With max_workers=1 the pages are processed one at a time in this process.
+    """
+    print(f"Starting Tesseract OCR extraction for: {os.path.basename(pdf_path)}")
+    
+    with fitz.open(pdf_path) as doc:
+        page_count = len(doc)
+    page_args = [(pdf_path, page_index, dpi) for page_index in range(page_count)]
+    
+    # Pages are OCRed in parallel, so each worker's Tesseract runs on one thread
+    executor = (
+        ProcessPoolExecutor(max_workers=max_workers, initializer=_limit_tesseract_threads)
+        if max_workers != 1 else None
+    )
+    try:
+        results = executor.map(_ocr_page, page_args, chunksize=4) if executor else map(_ocr_page, page_args)
+        
+        # Results arrive in page order, so they can be written as they complete
+        with open(output_txt_path, 'w', encoding='utf-8') as out_file:
+            for page_number, (text, error) in enumerate(results, start=1):
+                print(f"  Processed page {page_number}/{page_count} with OCR")
+                if error is not None:
+                    print(f"  Warning: Error processing page {page_number}: {error}")
+                    continue
                 out_file.write(text.strip())
-                
-            except Exception as e:
-                print(f"  Warning: Error processing page {page_number}: {e}")
+    finally:
+        if executor:
+            executor.shutdown()
     
-    doc.close()
     print(f"Tesseract OCR extraction complete. Saved to: {output_txt_path}")
 
 
-def process_pdf_with_dual_extraction(pdf_path: str, output_dir: str = None):
+def process_pdf_with_dual_extraction(pdf_path: str, output_dir: str = None, ocr_workers: int = None):
     """
     Extract text from a PDF using both methods and save to separate files.
     
     Args:
         pdf_path: Path to the input PDF file
         output_dir: Directory to save output files (defaults to same as PDF)
+        ocr_workers: Worker processes for per-page OCR (1 runs pages serially)
     """
     pdf_path = Path(pdf_path)
     
@@ -98,7 +129,7 @@ def process_pdf_with_dual_extraction(pdf_path: str, output_dir: str = None):
         print(f"PyMuPDF extraction failed: {e}")
     
     try:
-        extract_text_with_ocr(str(pdf_path), str(tesseract_output))
+        extract_text_with_ocr(str(pdf_path), str(tesseract_output), max_workers=ocr_workers)
     except Exception as e:
         print(f"Tesseract extraction failed: {e}")
     
@@ -118,8 +149,8 @@ def process_pdf_with_dual_extraction(pdf_path: str, output_dir: str = None):
     print(f"\nTip: Compare the files to see which method works better for your PDF quality!")
 
 
-def process_pdf_directory(folder_path: str, output_dir: str = None):
-    """Process all PDFs in a folder with both extraction methods."""
+def process_pdf_directory(folder_path: str, output_dir: str = None, max_workers: int = None):
+    """Process all PDFs in a folder with both extraction methods, one PDF per worker process."""
     folder_path = Path(folder_path)
     
     if not folder_path.exists():
@@ -134,11 +165,20 @@ def process_pdf_directory(folder_path: str, output_dir: str = None):
     
     print(f"Found {len(pdf_files)} PDF files to process")
     
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"\n{'='*80}")
-        print(f"Processing {i}/{len(pdf_files)}: {pdf_file.name}")
-        print('='*80)
-        process_pdf_with_dual_extraction(str(pdf_file), output_dir)
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, len(pdf_files))
+    
+    # PDFs are processed in parallel, so pages are kept serial within each worker
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_limit_tesseract_threads) as executor:
+        futures = {
+            executor.submit(process_pdf_with_dual_extraction, str(pdf_file), output_dir, 1): pdf_file
+            for pdf_file in pdf_files
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            future.result()
+            print(f"\n{'='*80}")
+            print(f"Finished {i}/{len(pdf_files)}: {futures[future].name}")
+            print('='*80)
 
 
 
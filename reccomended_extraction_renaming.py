@@ -16,15 +16,15 @@ suffixes_to_remove = [
     "_from_csv",
     "_manual_extraction"
 ]
+suffix_re = re.compile("|".join(suffixes_to_remove), flags=re.IGNORECASE)
 
 # Go through all .txt files in the input folder
-for filename in os.listdir(input_folder):
+for entry in os.scandir(input_folder):
+    filename = entry.name
     if filename.endswith(".txt"):
-        new_filename = filename
-        for suffix in suffixes_to_remove:
-            new_filename = re.sub(suffix, "", new_filename, flags=re.IGNORECASE)
-        
-        src_path = os.path.join(input_folder, filename)
+        new_filename = suffix_re.sub("", filename)
+
+        src_path = entry.path
         dest_path = os.path.join(output_folder, new_filename)
 
         shutil.copyfile(src_path, dest_path)
@@ -1,6 +1,8 @@
 import pandas as pd
 from pathlib import Path
 import shutil
+import subprocess
+import sys
 import re
 
 # --- CONFIGURATION ---
@@ -27,6 +29,17 @@ special_cases = {
 
 rename_log = []
 
+# Below this size spawning cp costs more than copying the bytes
+CLONE_MIN_BYTES = 1 << 20
+
+
+def clone_file(src: Path, dest: Path):
+    """Copy a file, as an APFS copy-on-write clone on macOS when it is large enough."""
+    if sys.platform == "darwin" and src.stat().st_size >= CLONE_MIN_BYTES:
+        if subprocess.run(["cp", "-c", str(src), str(dest)], capture_output=True).returncode == 0:
+            return
+    shutil.copy(src, dest)
+
 # --- HANDLE FILES WITH PARTY CODES (e.g. 51320_198706.pdf) ---
 def handle_code_files(folder: Path, ext: str):
     for file_path in folder.glob(f"*.{ext}"):
@@ -37,7 +50,7 @@ def handle_code_files(folder: Path, ext: str):
         year, month = yyyymm[:4], yyyymm[4:]
         party = party_code_map.get(code, code)
         new_name = f"{year}-{month}-{party}.{ext}"
-        shutil.copy(file_path, output_folder / new_name)
+        clone_file(file_path, output_folder / new_name)
         rename_log.append((file_path.name, new_name))
 
 # --- HANDLE FILES IN ADDITIONAL FOLDER ---
@@ -58,7 +71,7 @@ def handle_additional_files(folder: Path):
         else:
             continue
 
-        shutil.copy(file_path, output_folder / new_name)
+        clone_file(file_path, output_folder / new_name)
         rename_log.append((file_path.name, new_name))
 
 # --- EXECUTE RENAMING ---
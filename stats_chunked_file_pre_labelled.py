@@ -4,11 +4,14 @@ import pandas as pd
 input_path = '/Users/user/programming/manifestos_and_identity/3_chunked/chunks.csv'
 output_path = '/Users/user/programming/manifestos_and_identity/4_statistical_summaries/chunks_summary_stats.csv'
 
-# Load the CSV
-df = pd.read_csv(input_path)
+# Load the CSV, with pyarrow's multithreaded reader when it is installed
+try:
+    df = pd.read_csv(input_path, usecols=["document_name", "chunk_number", "chunk_text"], engine="pyarrow")
+except ImportError:
+    df = pd.read_csv(input_path, usecols=["document_name", "chunk_number", "chunk_text"])
 
 # Ensure chunk text is string type and calculate word count per chunk
-df['chunk_word_count'] = df['chunk_text'].apply(lambda x: len(str(x).split()))
+df['chunk_word_count'] = df['chunk_text'].astype(str).str.split().str.len()
 
 # Group by document and compute summary statistics
 summary = df.groupby('document_name').agg(
@@ -4,12 +4,15 @@ import pandas as pd
 input_file = "/Users/user/programming/manifestos_and_identity/5_labelled/labelled.csv"
 output_file = "/Users/user/programming/manifestos_and_identity/5_labelled/labelled_summary_stats.csv"
 
-# --- Load input ---
-df = pd.read_csv(input_file)
+# --- Load input (pyarrow's multithreaded reader when it is installed) ---
+try:
+    df = pd.read_csv(input_file, engine="pyarrow")
+except ImportError:
+    df = pd.read_csv(input_file)
 
 # --- Add word count for each chunk if not already present ---
 if "word_count" not in df.columns:
-    df["word_count"] = df["chunk_text"].str.split().apply(len)
+    df["word_count"] = df["chunk_text"].str.split().str.len()
 
 # --- Define constructs explicitly ---
 constructs = [
@@ -1,9 +1,112 @@
+import logging
+import mmap
 import os
 import re
 from pathlib import Path
 from typing import List, Tuple, Dict
 import string
 import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
+
+
+# Fixed patterns used by the TextCleaner passes, compiled once at import
+_MANIFESTO_HEADER_RE = re.compile(r'^\s*manifesto\s*$', re.IGNORECASE | re.MULTILINE)
+_LABOUR_HEADER_RE = re.compile(r'^\s*MANIFESTO\s+OF\s+THE\s+LABOUR\s+PARTY\s*$', re.IGNORECASE | re.MULTILINE)
+_SINGLE_LETTER_FRAGMENT_RE = re.compile(r'\b([a-zA-Z])\s+([a-zA-Z])\s+([a-zA-Z])\b')
+_THREE_DIGIT_FRAGMENT_RE = re.compile(r'\b(\d)\s+(\d)\s+(\d)\b')
+_TWO_DIGIT_FRAGMENT_RE = re.compile(r'\b(\d)\s+(\d)\b')
+_ASCII_CONTROL_CHAR_RE = re.compile(r'[\x00-\x08\x0b-\x1f\x7f]')
+_ROUTLEDGE_RE = re.compile(r'Routledge\.', re.IGNORECASE)
+_MULTIPLE_SPACES_RE = re.compile(r' +')
+_MULTIPLE_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_PAGE_NUMBER_LINE_RE = re.compile(r'^-?\s*\d{1,3}\s*-?$')
+_LINE_END_HYPHEN_RE = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+_HYPHENATED_WORD_RE = re.compile(r'(\w+)-(\w+)')
+_SPACE_BEFORE_PUNCTUATION_RE = re.compile(r'\s+([.,;:!?])')
+_MISSING_SPACE_AFTER_PUNCTUATION_RE = re.compile(r'([.,;:!?])(?=[A-Za-z])')
+_SPACE_BEFORE_DOUBLE_QUOTE_RE = re.compile(r'\s+"')
+_SPACE_AFTER_DOUBLE_QUOTE_RE = re.compile(r'"\s+')
+_SPACE_BEFORE_SINGLE_QUOTE_RE = re.compile(r"\s+'")
+_SPACE_AFTER_SINGLE_QUOTE_RE = re.compile(r"'\s+")
+# A whole line (with its newline) that is only whitespace, dots, underscores or dashes,
+# or that is longer than 5 characters but made of at most two distinct characters once stripped.
+# The (?=(...))\N groups match their runs atomically to avoid quadratic backtracking.
+_EXCESSIVE_WHITESPACE_LINE_RE = re.compile(
+    r'^(?:(?:[^\S\n]|[._-])*|(?=[^\n]{6})[^\S\n]*(\S)(?=(\1*))\2(?:([^\n])(?=((?:\1|\3)*))\4)?[^\S\n]*)\n',
+    re.MULTILINE,
+)
+
+# Word-level OCR fixes, applied in order
+_OCR_WORD_FIXES = [
+    # Fix "l" misread as "1" in common words
+    (re.compile(r'\b1ike\b', re.IGNORECASE), 'like'),
+    (re.compile(r'\b1ive\b', re.IGNORECASE), 'live'),
+    (re.compile(r'\b1ater\b', re.IGNORECASE), 'later'),
+    (re.compile(r'\b1ess\b', re.IGNORECASE), 'less'),
+    # Fix "I" misread as "l" at start of sentences
+    (re.compile(r'(^|\. )l\b'), r'\1I'),
+    # Fix common OCR errors with context
+    (re.compile(r'\bls\b'), 'is'),
+    (re.compile(r'\blf\b'), 'If'),
+    (re.compile(r'\bln\b'), 'In'),
+    (re.compile(r'\blt\b'), 'It'),
+]
+
+
+# Translation table that deletes ASCII punctuation, used to count it in C
+_PUNCTUATION_DELETE_TABLE = str.maketrans('', '', string.punctuation)
+
+
+class _ControlCharDeleteTable(dict):
+    """str.translate table deleting control characters except newlines and tabs.
+
+    Covers every codepoint in a Unicode "C" category (control, format, surrogate,
+    private use, unassigned); entries are filled in lazily the first time a
+    codepoint is seen, so lookups after that stay in C.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = None if char not in '\n\t' and unicodedata.category(char).startswith('C') else codepoint
+        self[codepoint] = value
+        return value
+
+
+_CONTROL_CHAR_DELETE_TABLE = _ControlCharDeleteTable()
+
+
+def _join_short_hyphenated(match):
+    """Join a hyphenated pair unless both parts are longer than 2 characters."""
+    start1, end1 = match.span(1)
+    start2, end2 = match.span(2)
+    if end1 - start1 > 2 and end2 - start2 > 2:
+        return match.group(0)
+    return match.group(1) + match.group(2)
+
+
+def _read_text_file(path, encoding: str = 'utf-8') -> str:
+    """Read a text file, memory-mapping it unless it is smaller than a page."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+            text = f.read().decode(encoding)
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Decode from the mapping itself, without first copying it into bytes
+                text = str(mm, encoding)
+    # Match the newline translation of reading in text mode
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _write_text_file(path, text: str, encoding: str = 'utf-8'):
+    """Encode text once and write the bytes in one call, skipping the text-mode encoder."""
+    data = text.encode(encoding)
+    with open(path, 'wb') as f:
+        f.write(data)
 
 
 class TextCleaner:
@@ -79,24 +182,32 @@ class TextCleaner:
             r'^\s*\d{1,3}\s*$',  # Lines with just page numbers
         ]
 
+        # Each compiled disclaimer is paired with whether it can only match text containing "Routledge."
+        self._disclaimer_res = [
+            (re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL), r'Routledge\.' in pattern)
+            for pattern in self.disclaimer_patterns
+        ]
+
+        self._noise_res = [re.compile(pattern, re.IGNORECASE) for pattern in self.noise_patterns]
+        self._term_fix_res = [
+            (re.compile(r'\b' + fragmented + r'\b', re.IGNORECASE), fixed)
+            for fragmented, fixed in self.term_fixes.items()
+        ]
+
     def normalize_unicode(self, text: str) -> str:
         """Normalize unicode characters and remove non-printable characters."""
+        # ASCII text is already NFKC-normalized, so only control characters could change
+        if text.isascii() and not _ASCII_CONTROL_CHAR_RE.search(text):
+            return text
+        
         # Normalize unicode
         text = unicodedata.normalize('NFKC', text)
         
-        # Remove zero-width characters and other invisible unicode
-        invisible_chars = [
-            '\u200b',  # Zero-width space
-            '\u200c',  # Zero-width non-joiner
-            '\u200d',  # Zero-width joiner
-            '\ufeff',  # Zero-width no-break space
-            '\u2060',  # Word joiner
-        ]
-        for char in invisible_chars:
-            text = text.replace(char, '')
-        
-        # Remove control characters except newlines and tabs
-        text = ''.join(char for char in text if char in '\n\t' or not unicodedata.category(char).startswith('C'))
+        # Remove control characters except newlines and tabs. This also removes
+        # zero-width characters and other invisible unicode (zero-width space,
+        # (non-)joiner, zero-width no-break space, word joiner), which are format
+        # characters.
+        text = text.translate(_CONTROL_CHAR_DELETE_TABLE)
         
         return text
 
@@ -106,93 +217,80 @@ class TextCleaner:
         for wrong, right in self.ocr_char_replacements.items():
             text = text.replace(wrong, right)
         
-        # Fix specific patterns
-        # Fix "l" misread as "1" in common words
-        text = re.sub(r'\b1ike\b', 'like', text, flags=re.IGNORECASE)
-        text = re.sub(r'\b1ive\b', 'live', text, flags=re.IGNORECASE)
-        text = re.sub(r'\b1ater\b', 'later', text, flags=re.IGNORECASE)
-        text = re.sub(r'\b1ess\b', 'less', text, flags=re.IGNORECASE)
-        
-        # Fix "I" misread as "l" at start of sentences
-        text = re.sub(r'(^|\. )l\b', r'\1I', text)
-        
-        # Fix common OCR errors with context
-        text = re.sub(r'\bls\b', 'is', text)
-        text = re.sub(r'\blf\b', 'If', text)
-        text = re.sub(r'\bln\b', 'In', text)
-        text = re.sub(r'\blt\b', 'It', text)
-        text = re.sub(r'\bls\b', 'is', text)
+        # Fix specific word-level patterns
+        for pattern, replacement in _OCR_WORD_FIXES:
+            text = pattern.sub(replacement, text)
         
         return text
 
     def remove_noise_patterns(self, text: str) -> str:
         """Remove common OCR artifacts and noise patterns."""
-        for pattern in self.noise_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        for noise_re in self._noise_res:
+            text = noise_re.sub('', text)
         return text
 
     def remove_historical_disclaimers(self, text: str) -> str:
         """Remove the historical collection disclaimers."""
-        for pattern in self.disclaimer_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
+        # The collection disclaimers all end with "Routledge."; skip those scans when it never appears
+        has_routledge = _ROUTLEDGE_RE.search(text) is not None
+        for disclaimer_re, needs_routledge in self._disclaimer_res:
+            if needs_routledge and not has_routledge:
+                continue
+            text = disclaimer_re.sub('', text)
         
         # Also remove the specific manifesto/MANIFESTO headers that appear in some files
-        text = re.sub(r'^\s*manifesto\s*$', '', text, flags=re.IGNORECASE | re.MULTILINE)
-        text = re.sub(r'^\s*MANIFESTO\s+OF\s+THE\s+LABOUR\s+PARTY\s*$', '', text, flags=re.IGNORECASE | re.MULTILINE)
+        text = _MANIFESTO_HEADER_RE.sub('', text)
+        text = _LABOUR_HEADER_RE.sub('', text)
         
         return text
 
     def fix_fragmented_text(self, text: str) -> str:
         """Fix fragmented words and abbreviations."""
         # Fix known term fragmentations
-        for fragmented, fixed in self.term_fixes.items():
-            text = re.sub(r'\b' + fragmented + r'\b', fixed, text, flags=re.IGNORECASE)
+        for term_re, fixed in self._term_fix_res:
+            text = term_re.sub(fixed, text)
         
         # Fix single character fragments (common OCR issue)
-        text = re.sub(r'\b([a-zA-Z])\s+([a-zA-Z])\s+([a-zA-Z])\b', r'\1\2\3', text)
+        text = _SINGLE_LETTER_FRAGMENT_RE.sub(r'\1\2\3', text)
         
         # Fix numbers that got spaces inserted
-        text = re.sub(r'\b(\d)\s+(\d)\s+(\d)\b', r'\1\2\3', text)
-        text = re.sub(r'\b(\d)\s+(\d)\b', r'\1\2', text)
+        text = _THREE_DIGIT_FRAGMENT_RE.sub(r'\1\2\3', text)
+        text = _TWO_DIGIT_FRAGMENT_RE.sub(r'\1\2', text)
         
         return text
 
     def fix_punctuation_spacing(self, text: str) -> str:
         """Fix spacing around punctuation marks."""
         # Remove spaces before punctuation
-        text = re.sub(r'\s+([.,;:!?])', r'\1', text)
+        text = _SPACE_BEFORE_PUNCTUATION_RE.sub(r'\1', text)
         
         # Add space after punctuation if missing (but not for decimals)
-        text = re.sub(r'([.,;:!?])(?=[A-Za-z])', r'\1 ', text)
-        
-        # Fix decimal numbers that got spaces
-        text = re.sub(r'(\d)\s+\.\s+(\d)', r'\1.\2', text)
+        text = _MISSING_SPACE_AFTER_PUNCTUATION_RE.sub(r'\1 ', text)
         
         # Fix spacing around quotes
-        text = re.sub(r'\s+"', ' "', text)
-        text = re.sub(r'"\s+', '" ', text)
-        text = re.sub(r"\s+'", " '", text)
-        text = re.sub(r"'\s+", "' ", text)
+        text = _SPACE_BEFORE_DOUBLE_QUOTE_RE.sub(' "', text)
+        text = _SPACE_AFTER_DOUBLE_QUOTE_RE.sub('" ', text)
+        text = _SPACE_BEFORE_SINGLE_QUOTE_RE.sub(" '", text)
+        text = _SPACE_AFTER_SINGLE_QUOTE_RE.sub("' ", text)
         
         return text
 
     def normalize_spacing(self, text: str) -> str:
         """Normalize whitespace and line breaks."""
         # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        text = _MULTIPLE_SPACES_RE.sub(' ', text)
         
         # Replace tabs with spaces
         text = text.replace('\t', ' ')
         
         # Replace multiple line breaks with double line break (paragraph separation)
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = _MULTIPLE_BLANK_LINES_RE.sub('\n\n', text)
         
         # Fix lines that end mid-sentence (common in PDF extraction)
-        lines = text.split('\n')
+        lines = [line.strip() for line in text.split('\n')]
         cleaned_lines = []
         
         for i, line in enumerate(lines):
-            line = line.strip()
             if not line:
                 cleaned_lines.append('')
                 continue
@@ -200,10 +298,9 @@ class TextCleaner:
             # If line doesn't end with punctuation and next line starts with lowercase,
             # probably should be joined
             if (i < len(lines) - 1 and 
-                line and 
                 not line[-1] in '.!?:;"\'' and 
-                lines[i + 1].strip() and 
-                lines[i + 1].strip()[0].islower()):
+                lines[i + 1] and 
+                lines[i + 1][0].islower()):
                 line += ' '
             
             cleaned_lines.append(line)
@@ -214,28 +311,16 @@ class TextCleaner:
         """Remove repeated headers, footers, and website references."""
         lines = text.split('\n')
         
+        # Key substantial lines by the hash of their normalized form, so only
+        # ints are kept rather than a lowercased copy of every line
+        normalized_lines = (line.strip().lower() for line in lines)
+        line_keys = [hash(clean_line) if len(clean_line) > 10 else None for clean_line in normalized_lines]
+        
         # Find lines that appear multiple times (likely headers/footers)
-        line_counts = {}
-        for line in lines:
-            clean_line = line.strip().lower()
-            if len(clean_line) > 10:  # Only consider substantial lines
-                line_counts[clean_line] = line_counts.get(clean_line, 0) + 1
-        
-        # Remove lines that appear more than twice (likely repetitive)
-        filtered_lines = []
-        seen_repetitive = set()
-        
-        for line in lines:
-            clean_line = line.strip().lower()
-            if (line_counts.get(clean_line, 0) > 2 and 
-                clean_line not in seen_repetitive and
-                len(clean_line) > 10):
-                seen_repetitive.add(clean_line)
-                continue
-            elif clean_line in seen_repetitive:
-                continue
-            else:
-                filtered_lines.append(line)
+        line_counts = Counter(key for key in line_keys if key is not None)
+        
+        # Remove every copy of lines that appear more than twice (likely repetitive)
+        filtered_lines = [line for line, key in zip(lines, line_keys) if line_counts[key] <= 2]
         
         return '\n'.join(filtered_lines)
 
@@ -248,12 +333,11 @@ class TextCleaner:
         for paragraph in paragraphs:
             if not paragraph.strip():
                 continue
-                
-            lines = paragraph.split('\n')
+            
             fixed_lines = []
             current_sentence = ""
             
-            for line in lines:
+            for line in paragraph.split('\n'):
                 line = line.strip()
                 if not line:
                     continue
@@ -263,7 +347,7 @@ class TextCleaner:
                 # they probably belong together
                 if (current_sentence and 
                     not current_sentence[-1] in '.!?:' and 
-                    line and line[0].islower()):
+                    line[0].islower()):
                     current_sentence += " " + line
                 else:
                     if current_sentence:
@@ -273,101 +357,94 @@ class TextCleaner:
             if current_sentence:
                 fixed_lines.append(current_sentence)
             
-            if fixed_lines:
-                fixed_paragraphs.append('\n'.join(fixed_lines))
+            fixed_paragraphs.append('\n'.join(fixed_lines))
         
         return '\n\n'.join(fixed_paragraphs)
 
     def remove_isolated_characters(self, text: str) -> str:
         """Remove isolated single characters that are likely OCR artifacts."""
         # Remove lines with only single characters or very short meaningless content
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            # Skip lines that are just single characters, numbers, or very short
-            if (len(line) <= 2 and 
-                not line.isdigit() and 
-                line not in ['UK', 'EU', 'US', 'UN', 'MP', 'PM']):  # Keep important abbreviations
-                continue
-            # Skip lines with mostly special characters
-            if len(line) > 0 and sum(c in string.punctuation for c in line) / len(line) > 0.7:
-                continue
-            # Skip lines that are just page numbers
-            if re.match(r'^-?\s*\d{1,3}\s*-?$', line):
-                continue
-            cleaned_lines.append(line)
-        
-        return '\n'.join(cleaned_lines)
+        stripped_lines = (line.strip() for line in text.split('\n'))
+        return '\n'.join(line for line in stripped_lines if not self._is_isolated_line(line))
+
+    @staticmethod
+    def _is_isolated_line(line: str) -> bool:
+        """Whether a stripped line is an isolated character, symbol run or page number."""
+        # Lines that are just single characters, numbers, or very short
+        if (len(line) <= 2 and 
+            not line.isdigit() and 
+            line not in ['UK', 'EU', 'US', 'UN', 'MP', 'PM']):  # Keep important abbreviations
+            return True
+        # Lines with mostly special characters
+        if len(line) > 0 and (len(line) - len(line.translate(_PUNCTUATION_DELETE_TABLE))) / len(line) > 0.7:
+            return True
+        # Lines that are just page numbers
+        return _PAGE_NUMBER_LINE_RE.match(line) is not None
 
     def fix_word_breaks(self, text: str) -> str:
         """Fix words broken with hyphens at line ends."""
         # Fix hyphenated words at line ends
-        text = re.sub(r'(\w+)-\s*\n\s*(\w+)', r'\1\2', text)
+        text = _LINE_END_HYPHEN_RE.sub(r'\1\2', text)
         
         # But preserve intentional hyphenated words
         # This is a simple heuristic - could be improved
-        text = re.sub(r'(\w+)-(\w+)', lambda m: m.group(0) if len(m.group(1)) > 2 and len(m.group(2)) > 2 else m.group(1) + m.group(2), text)
+        text = _HYPHENATED_WORD_RE.sub(_join_short_hyphenated, text)
         
         return text
 
     def remove_excessive_whitespace_lines(self, text: str) -> str:
         """Remove lines that are mostly whitespace or dots."""
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Skip lines that are mostly dots, underscores, dashes, or spaces
-            if re.match(r'^[\s._-]*$', line):
-                continue
-            # Skip lines with repetitive characters (like ...........)
-            if len(line) > 5 and len(set(line.strip())) <= 2:
-                continue
-            cleaned_lines.append(line)
-        
-        return '\n'.join(cleaned_lines)
+        # Delete each unwanted line together with its newline in a single pass.
+        # A newline is appended first so the last line is handled the same way,
+        # then dropped again from the result.
+        # Skips lines that are mostly dots, underscores, dashes, or spaces,
+        # and lines with repetitive characters (like ...........)
+        return _EXCESSIVE_WHITESPACE_LINE_RE.sub('', text + '\n')[:-1]
 
     def clean_text(self, text: str) -> str:
         """Apply all cleaning steps to the text."""
-        print("  Normalizing unicode...")
+        # No pass can produce content from whitespace, so there is nothing to clean
+        if not text.strip():
+            return ''
+        
+        logger.debug("Normalizing unicode...")
         text = self.normalize_unicode(text)
         
-        print("  Removing historical disclaimers...")
+        logger.debug("Removing historical disclaimers...")
         text = self.remove_historical_disclaimers(text)
         
-        print("  Fixing OCR character errors...")
+        logger.debug("Fixing OCR character errors...")
         text = self.fix_ocr_character_errors(text)
         
-        print("  Removing noise patterns...")
+        logger.debug("Removing noise patterns...")
         text = self.remove_noise_patterns(text)
         
-        print("  Fixing fragmented text...")
+        logger.debug("Fixing fragmented text...")
         text = self.fix_fragmented_text(text)
         
-        print("  Fixing punctuation spacing...")
+        logger.debug("Fixing punctuation spacing...")
         text = self.fix_punctuation_spacing(text)
         
-        print("  Removing isolated characters...")
+        logger.debug("Removing isolated characters...")
         text = self.remove_isolated_characters(text)
         
-        print("  Fixing word breaks...")
+        logger.debug("Fixing word breaks...")
         text = self.fix_word_breaks(text)
         
-        print("  Removing excessive whitespace lines...")
+        logger.debug("Removing excessive whitespace lines...")
         text = self.remove_excessive_whitespace_lines(text)
         
-        print("  Removing header/footer repetition...")
+        logger.debug("Removing header/footer repetition...")
         text = self.remove_header_footer_repetition(text)
         
-        print("  Fixing broken sentences...")
+        logger.debug("Fixing broken sentences...")
         text = self.fix_broken_sentences(text)
         
-        print("  Normalizing spacing...")
+        logger.debug("Normalizing spacing...")
         text = self.normalize_spacing(text)
         
         # Final cleanup
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Normalize paragraph breaks
+        text = _MULTIPLE_BLANK_LINES_RE.sub('\n\n', text)  # Normalize paragraph breaks
         text = text.strip()
         
         return text
@@ -378,7 +455,7 @@ def clean_manifesto_file(input_path: str, output_path: str = None) -> str:
     input_path = Path(input_path)
     
     if not input_path.exists():
-        print(f"Error: File not found: {input_path}")
+        logger.error(f"File not found: {input_path}")
         return None
     
     # Generate output path if not provided
@@ -387,19 +464,17 @@ def clean_manifesto_file(input_path: str, output_path: str = None) -> str:
     else:
         output_path = Path(output_path)
     
-    print(f"Cleaning: {input_path.name}")
+    logger.info(f"Cleaning: {input_path.name}")
     
     # Read the input file
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            text = f.read()
+        text = _read_text_file(input_path, encoding='utf-8')
     except UnicodeDecodeError:
         # Try different encodings if UTF-8 fails
         try:
-            with open(input_path, 'r', encoding='latin-1') as f:
-                text = f.read()
+            text = _read_text_file(input_path, encoding='latin-1')
         except Exception as e:
-            print(f"Error reading file: {e}")
+            logger.error(f"Error reading file {input_path}: {e}")
             return None
     
     # Clean the text
@@ -408,17 +483,16 @@ def clean_manifesto_file(input_path: str, output_path: str = None) -> str:
     
     # Write the cleaned text
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(cleaned_text)
-        print(f"Cleaned text saved to: {output_path}")
+        _write_text_file(output_path, cleaned_text)
+        logger.info(f"Cleaned text saved to: {output_path}")
         return str(output_path)
     except Exception as e:
-        print(f"Error saving cleaned file: {e}")
+        logger.error(f"Error saving cleaned file {output_path}: {e}")
         return None
 
 
-def clean_manifesto_directory(input_dir: str, output_dir: str = None):
-    """Clean all text files in a directory."""
+def clean_manifesto_directory(input_dir: str, output_dir: str = None, max_workers: int = None):
+    """Clean all text files in a directory, one worker process per file at a time."""
     input_dir = Path(input_dir)
     
     if not input_dir.exists():
@@ -444,11 +518,19 @@ def clean_manifesto_directory(input_dir: str, output_dir: str = None):
     print(f"Output directory: {output_dir}")
     print("-" * 60)
     
-    # Process each file
-    for i, text_file in enumerate(text_files, 1):
-        print(f"\n[{i}/{len(text_files)}]")
-        output_path = output_dir / f"{text_file.stem}.txt"
-        clean_manifesto_file(str(text_file), str(output_path))
+    # Process the files in parallel; each file is cleaned independently
+    input_paths = [str(text_file) for text_file in text_files]
+    output_paths = [str(output_dir / f"{text_file.stem}.txt") for text_file in text_files]
+    
+    failed_files = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(clean_manifesto_file, input_paths, output_paths)
+        for text_file, result in tqdm(zip(text_files, results), total=len(text_files), desc="Cleaning"):
+            if result is None:
+                failed_files.append(text_file.name)
+    
+    if failed_files:
+        print(f"Failed to clean {len(failed_files)} files: {', '.join(failed_files)}")
     
     print(f"\n{'='*60}")
     print("CLEANING COMPLETE")
@@ -1,86 +1,150 @@
 from __future__ import annotations
 
+import mmap
 import os
 import re
 from pathlib import Path
 import csv
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
+_GROUP_RE = re.compile(r"(.+?)_(tesseract_extraction|pymupdf_extraction|from_csv)(?:_cleaned)?\.txt")
 
 def extract_group_key(filename):
+    """Return (group_key, method) for an extraction file name, or (None, None)."""
     # Match any of the 3 suffix types, with or without _cleaned
-    match = re.match(r"(.+?)_(tesseract_extraction|pymupdf_extraction|from_csv)(?:_cleaned)?\.txt", filename)
+    match = _GROUP_RE.match(filename)
     if match:
-        return match.group(1)
-    return None
-
-def word_count(text):
-    return len(text.split())
+        return match.group(1), match.group(2)
+    return None, None
 
-def sentence_count(text):
-    return len(re.findall(r'[.!?]', text))
+# Filename endings recognised by extract_group_key, with the method each one names
+_GROUP_SUFFIXES = tuple(
+    (f"_{method}{cleaned}.txt", method)
+    for method in ("tesseract_extraction", "pymupdf_extraction", "from_csv")
+    for cleaned in ("", "_cleaned")
+)
 
-def character_count(text):
-    return len(text)
+def _fast_group_key(filename):
+    """extract_group_key using only str operations, falling back to the regex for unusual names."""
+    for suffix, method in _GROUP_SUFFIXES:
+        if filename.endswith(suffix):
+            prefix = filename[:-len(suffix)]
+            # The regex takes the shortest prefix, which may end before an earlier
+            # ".txt", and its "." does not match newlines
+            if prefix and ".txt" not in prefix and "\n" not in prefix:
+                return prefix, method
+            break
+    return extract_group_key(filename)
 
-def ocr_error_rate(text):
-    return sum(1 for word in text.split() if re.search(r'[^-]', word)) / max(len(text.split()), 1)
+def compute_metrics(text):
+    """Compute all metrics for one text in a single split plus C-level str.count scans.
 
-def average_word_length(text):
+    Returns (word_count, sentence_count, character_count, ocr_error_rate,
+    average_word_length, punctuation_frequency), where sentences are counted
+    by '.', '!' and '?', the OCR error rate is the share of words that are not
+    made up only of hyphens, and punctuation frequency is the share of
+    characters in '.,;:!?'.
+    """
     words = text.split()
-    return sum(len(word) for word in words) / max(len(words), 1)
+    total_words = len(words)
+    char_count = len(text)
+    # A word counts towards the OCR error rate unless it is made up only of hyphens
+    if '-' in text:
+        counted_words = total_words - list(map(str.strip, words, repeat('-'))).count('')
+    else:
+        counted_words = total_words
+    sentence_ends = text.count('.') + text.count('!') + text.count('?')
+    punctuation = sentence_ends + text.count(',') + text.count(';') + text.count(':')
+    return (
+        total_words,
+        sentence_ends,
+        char_count,
+        counted_words / max(total_words, 1),
+        sum(map(len, words)) / max(total_words, 1),
+        punctuation / max(char_count, 1),
+    )
+
+def _read_text_file(path):
+    """Read a UTF-8 text file, decoding straight off a memory map unless it is smaller than a page."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+            text = f.read().decode('utf-8')
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, 'utf-8')
+    return text.replace('\r\n', '\n').replace('\r', '\n')
 
-def punctuation_frequency(text):
-    return sum(1 for c in text if c in '.,;:!?') / max(len(text), 1)
+def _metric_group(item):
+    """Read each file in a (group, {method: path}) item and compute its metrics."""
+    group, methods = item
+    # Reads release the GIL, so overlap the group's 2-3 file reads in threads
+    with ThreadPoolExecutor(max_workers=len(methods)) as pool:
+        texts = list(pool.map(_read_text_file, methods.values()))
+    group_metrics = {method: compute_metrics(text) for method, text in zip(methods, texts)}
+    return group, group_metrics
+
+# Short labels used in the summary CSV
+_METHOD_LABELS = {
+    'from_csv': 'from_csv',
+    'pymupdf_extraction': 'PyMuPDF',
+    'tesseract_extraction': 'Tesseract'
+}
 
 def format_metric_list(values, method_order):
     """Format a list of values with method labels"""
     formatted = []
-    method_labels = {
-        'from_csv': 'from_csv',
-        'pymupdf_extraction': 'PyMuPDF',
-        'tesseract_extraction': 'Tesseract'
-    }
     
     for method, value in zip(method_order, values):
         if value is not None:
-            label = method_labels.get(method, method)
+            label = _METHOD_LABELS.get(method, method)
             if isinstance(value, float):
                 formatted.append(f"{label}:{value:.4f}")
             else:
                 formatted.append(f"{label}:{value}")
         else:
-            formatted.append(f"{method_labels.get(method, method)}:N/A")
+            formatted.append(f"{_METHOD_LABELS.get(method, method)}:N/A")
     
     return ", ".join(formatted)
 
 def calculate_recommendation(metrics_dict, method_order):
     """Calculate recommendation based on multiple metrics"""
     scores = {}
+    columns = zip(
+        method_order,
+        metrics_dict['word_counts'],
+        metrics_dict['char_counts'],
+        metrics_dict['ocr_error_rates'],
+        metrics_dict['avg_word_lengths'],
+        metrics_dict['punctuation_freqs'],
+    )
     
-    for i, method in enumerate(method_order):
+    for method, word_count, char_count, ocr_rate, avg_len, punct_freq in columns:
+        # Methods without an extraction have no metrics at all; skip them outright
+        if word_count is None and char_count is None and ocr_rate is None \
+                and avg_len is None and punct_freq is None:
+            continue
+
         score = 0
         valid_metrics = 0
         
         # Word count - higher is generally better (more complete extraction)
-        if metrics_dict['word_counts'][i] is not None:
-            word_score = metrics_dict['word_counts'][i]
-            score += word_score
+        if word_count is not None:
+            score += word_count
             valid_metrics += 1
         
         # Character count - higher is generally better
-        if metrics_dict['char_counts'][i] is not None:
-            char_score = metrics_dict['char_counts'][i] / 100  # Scale down
-            score += char_score
+        if char_count is not None:
+            score += char_count / 100  # Scale down
             valid_metrics += 1
         
         # OCR error rate - lower is better (invert the score)
-        if metrics_dict['ocr_error_rates'][i] is not None:
-            error_penalty = metrics_dict['ocr_error_rates'][i] * 1000  # Scale up as penalty
-            score -= error_penalty
+        if ocr_rate is not None:
+            score -= ocr_rate * 1000  # Scale up as penalty
             valid_metrics += 1
         
         # Average word length - should be reasonable (4-6 is typical)
-        if metrics_dict['avg_word_lengths'][i] is not None:
-            avg_len = metrics_dict['avg_word_lengths'][i]
+        if avg_len is not None:
             # Penalize very short or very long average word lengths
             if 4 <= avg_len <= 6:
                 score += 50
@@ -89,8 +153,7 @@ def calculate_recommendation(metrics_dict, method_order):
             valid_metrics += 1
         
         # Punctuation frequency - moderate is better
-        if metrics_dict['punctuation_freqs'][i] is not None:
-            punct_freq = metrics_dict['punctuation_freqs'][i]
+        if punct_freq is not None:
             # Ideal punctuation frequency around 0.05-0.15
             if 0.05 <= punct_freq <= 0.15:
                 score += 30
@@ -98,41 +161,34 @@ def calculate_recommendation(metrics_dict, method_order):
                 score -= abs(punct_freq - 0.1) * 100
             valid_metrics += 1
         
-        if valid_metrics > 0:
-            scores[method] = score / valid_metrics
+        scores[method] = score / valid_metrics
     
     if not scores:
         return "No data available"
     
     # Find the best method
     best_method = max(scores, key=scores.get)
-    method_labels = {
-        'from_csv': 'from_csv',
-        'pymupdf_extraction': 'PyMuPDF',
-        'tesseract_extraction': 'Tesseract'
-    }
-    
-    return method_labels.get(best_method, best_method)
+    return _METHOD_LABELS.get(best_method, best_method)
 
-def compare_folder(folder_path: str):
+def compare_folder(folder_path: str, max_workers: int = None):
     folder = Path(folder_path)
-    files = list(folder.glob("*.txt"))
+    with os.scandir(folder) as entries:
+        files = [folder / entry.name for entry in entries if entry.name.endswith(".txt") and entry.is_file()]
 
     grouped = {}
     for f in files:
-        group_key = extract_group_key(f.name)
+        group_key, method = _fast_group_key(f.name)
         if group_key:
-            grouped.setdefault(group_key, {})  # each group is a dict with methods as keys
-            if '_tesseract_extraction' in f.name:
-                grouped[group_key]['tesseract_extraction'] = f
-            elif '_pymupdf_extraction' in f.name:
-                grouped[group_key]['pymupdf_extraction'] = f
-            elif '_from_csv' in f.name:
-                grouped[group_key]['from_csv'] = f
+            # each group is a dict with methods as keys
+            grouped.setdefault(group_key, {})[method] = f
 
     if not grouped:
         raise FileNotFoundError(f"No matching *_extraction.txt or *_from_csv.txt in {folder}")
 
+    # Groups are independent, so read and measure them in parallel
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        metrics_by_group = list(executor.map(_metric_group, grouped.items()))
+
     output_file = folder / "comparison_summary.csv"
     with open(output_file, "w", newline='', encoding='utf-8') as csvfile:
         fieldnames = [
@@ -142,7 +198,7 @@ def compare_folder(folder_path: str):
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
 
-        for group, methods in grouped.items():
+        for group, group_metrics in metrics_by_group:
             # Define consistent method order
             method_order = ['from_csv', 'pymupdf_extraction', 'tesseract_extraction']
 
@@ -155,16 +211,14 @@ def compare_folder(folder_path: str):
             punctuation_freqs = []
 
             for method in method_order:
-                file = methods.get(method)
-                if file:
-                    with open(file, 'r', encoding='utf-8') as f:
-                        text = f.read()
-                    word_counts.append(word_count(text))
-                    sentence_counts.append(sentence_count(text))
-                    char_counts.append(character_count(text))
-                    ocr_error_rates.append(ocr_error_rate(text))
-                    avg_word_lengths.append(average_word_length(text))
-                    punctuation_freqs.append(punctuation_frequency(text))
+                metrics = group_metrics.get(method)
+                if metrics:
+                    word_counts.append(metrics[0])
+                    sentence_counts.append(metrics[1])
+                    char_counts.append(metrics[2])
+                    ocr_error_rates.append(metrics[3])
+                    avg_word_lengths.append(metrics[4])
+                    punctuation_freqs.append(metrics[5])
                 else:
                     word_counts.append(None)
                     sentence_counts.append(None)
@@ -1,109 +1,261 @@
+import csv
 import os
 import re
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from urllib.parse import unquote
 from pathlib import Path
-from nltk.tokenize import sent_tokenize
 import nltk
 
-# Ensure punkt is available
-nltk.download('punkt', download_dir='/Users/user/nltk_data')
-nltk.data.path.append('/Users/user/nltk_data')
+# Ensure punkt is available. Worker processes re-import this module, so only
+# download when the model is missing.
+NLTK_DIR = os.environ.get('NLTK_DATA', str(Path.home() / 'nltk_data'))
+nltk.data.path.append(NLTK_DIR)
+try:
+    nltk.data.find('tokenizers/punkt')
+except LookupError:
+    nltk.download('punkt', download_dir=NLTK_DIR)
 
 
+_sentence_tokenizer = None
 
-def fix_capitalisation(text, exceptions=None):
-    import re
-    if exceptions is None:
-        exceptions = set()
+# Patterns used on every word by fix_capitalisation
+_SENTENCE_END_RE = re.compile(r'([.!?])')
+_NON_WORD_RE = re.compile(r'[^\w]')
 
-    sentence_endings = re.compile(r'([.!?])')
-    parts = sentence_endings.split(text)
 
-    sentences = [''.join(pair).strip() for pair in zip(parts[0::2], parts[1::2])]
-    if len(parts) % 2 == 1:
-        sentences.append(parts[-1].strip())
+def _is_word_char(char):
+    """True for characters matched by the regex \\w."""
+    return char.isalnum() or char == '_'
+
+
+def _get_sentence_tokenizer():
+    """Load the English punkt model once per process (what sent_tokenize uses)."""
+    global _sentence_tokenizer
+    if _sentence_tokenizer is None:
+        try:
+            from nltk.tokenize import PunktTokenizer
+            _sentence_tokenizer = PunktTokenizer('english')
+        except ImportError:
+            _sentence_tokenizer = nltk.data.load('tokenizers/punkt/english.pickle')
+    return _sentence_tokenizer
 
-    corrected_sentences = []
-
-    for sentence in sentences:
-        words = sentence.split()
-        corrected_words = []
-        for i, word in enumerate(words):
-            clean_word = re.sub(r'[^\w]', '', word)
-            punct_prefix = re.match(r'^\W*', word).group()
-            punct_suffix = re.match(r'.*?(\W*)$', word).group(1)
-
-            if clean_word in exceptions:
-                corrected_word = word
-            elif clean_word.isupper():
-                if i == 0:
-                    corrected_word = clean_word.capitalize()
-                else:
-                    corrected_word = clean_word.lower()
-                corrected_word = f"{punct_prefix}{corrected_word}{punct_suffix}"
+
+@lru_cache(maxsize=100_000)
+def _fix_sentence(sentence, exceptions):
+    """Recapitalise one sentence; cached because boilerplate sentences recur across chunks."""
+    words = sentence.split()
+    corrected_words = []
+    for i, word in enumerate(words):
+        # Only words whose letters are all capitals change. For ASCII or purely
+        # alphabetic words, stripping non-word characters can't alter that, so
+        # skip the regex work for the common lower/mixed-case word.
+        if not word.isupper() and (word.isascii() or word.isalpha()):
+            corrected_words.append(word)
+            continue
+
+        # Split off the leading and trailing non-word runs (what \W* matches)
+        # by scanning in from each end
+        start, end = 0, len(word)
+        while start < end and not _is_word_char(word[start]):
+            start += 1
+        while end > start and not _is_word_char(word[end - 1]):
+            end -= 1
+        punct_prefix = word[:start]
+        punct_suffix = word[end:]
+        # Usually nothing is left to strip once the ends are off
+        clean_word = word[start:end]
+        if not clean_word.isalnum():
+            clean_word = _NON_WORD_RE.sub('', clean_word)
+
+        if clean_word in exceptions:
+            corrected_word = word
+        elif clean_word.isupper():
+            if i == 0:
+                corrected_word = clean_word.capitalize()
             else:
-                corrected_word = word
+                corrected_word = clean_word.lower()
+            corrected_word = f"{punct_prefix}{corrected_word}{punct_suffix}"
+        else:
+            corrected_word = word
 
-            corrected_words.append(corrected_word)
+        corrected_words.append(corrected_word)
 
-        corrected_sentences.append(' '.join(corrected_words))
+    return ' '.join(corrected_words)
 
-    return ' '.join(corrected_sentences)
 
+def fix_capitalisation(text, exceptions=None):
+    # The cached helper needs a hashable exceptions set
+    exceptions = frozenset(exceptions) if exceptions else frozenset()
 
-def split_cleaned_text_to_chunks(txt_path: str, max_length: int = 280):
+    parts = _SENTENCE_END_RE.split(text)
+
+    sentences = [''.join(pair).strip() for pair in zip(parts[0::2], parts[1::2])]
+    if len(parts) % 2 == 1:
+        sentences.append(parts[-1].strip())
+
+    return ' '.join([_fix_sentence(sentence, exceptions) for sentence in sentences])
+
+
+def _chunk_texts(txt_path: str, max_length: int = 280):
+    """Return the recapitalised chunks of one file in order; chunk i is number i + 1."""
     with open(txt_path, 'r', encoding='utf-8') as file:
         text = file.read()
 
-    sentences = sent_tokenize(text.replace('\n', ' ').strip())
+    text = text.replace('\n', ' ').strip()
 
     chunks = []
-    current_chunk = ""
-    chunk_number = 1
+    # Collect sentences in a list with a running length rather than growing a
+    # string, which re-copies the whole chunk on every sentence.
+    buf = []
+    buf_len = 0
 
-    for sentence in sentences:
-        if len(sentence) > max_length:
+    # span_tokenize yields the (start, end) offsets tokenize() would slice,
+    # so sentences too long to keep are dropped without being copied out.
+    for start, end in _get_sentence_tokenizer().span_tokenize(text):
+        sentence_len = end - start
+        if sentence_len > max_length:
             continue
-        if len(current_chunk) + len(sentence) + (1 if current_chunk else 0) <= max_length:
-            current_chunk += (" " if current_chunk else "") + sentence
+        sentence = text[start:end]
+        if buf_len + sentence_len + (1 if buf_len else 0) <= max_length:
+            buf_len += sentence_len + (1 if buf_len else 0)
+            buf.append(sentence)
         else:
-            chunks.append((chunk_number, current_chunk.strip()))
-            chunk_number += 1
-            current_chunk = sentence
+            chunks.append(fix_capitalisation(" ".join(buf).strip()))
+            buf = [sentence]
+            buf_len = sentence_len
+
+    if buf_len:
+        chunks.append(fix_capitalisation(" ".join(buf).strip()))
 
-    if current_chunk:
-        chunks.append((chunk_number, current_chunk.strip()))
+    return chunks
 
+
+def split_cleaned_text_to_chunks(txt_path: str, max_length: int = 280):
+    document_name = os.path.basename(txt_path)
     return [
-        {"document_name": os.path.basename(txt_path), "chunk_number": num, "chunk_text": chunk}
-        for num, chunk in [(n, fix_capitalisation(c)) for n, c in chunks]
+        {"document_name": document_name, "chunk_number": num, "chunk_text": chunk}
+        for num, chunk in enumerate(_chunk_texts(txt_path, max_length), start=1)
     ]
 
 
-def process_txt_folder(folder_path: str, output_csv: str):
+def _new_txt_files(folder_path: str, existing_files):
+    """List the .txt files in folder_path whose names are not in existing_files."""
+    new_files = []
+
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".txt") or not entry.is_file():
+                continue
+            if entry.name not in existing_files:
+                print(f"Processing new file: {entry.name}")
+                new_files.append(entry.path)
+            else:
+                print(f"Skipping existing file: {entry.name}")
+
+    return new_files
+
+
+def _chunk_files(file_paths, max_workers=None):
+    """Yield (document_name, chunk_texts) for each file, in order.
+
+    Files are chunked in worker processes; with max_workers=1, or a single
+    file, they are chunked in this process.
+    """
+    # Sentence tokenisation is pure Python, so spread the files over processes.
+    # A pool isn't worth starting (and loading punkt again) for one file.
+    use_pool = max_workers != 1 and len(file_paths) > 1
+    executor = ProcessPoolExecutor(max_workers=max_workers) if use_pool else None
+    try:
+        results = (executor.map(_chunk_texts, file_paths, chunksize=4) if executor
+                   else map(_chunk_texts, file_paths))
+        for file_path, chunks in zip(file_paths, results):
+            yield os.path.basename(file_path), chunks
+    finally:
+        if executor:
+            executor.shutdown()
+
+
+def process_txt_folder(folder_path: str, output_csv: str, max_workers=None):
+    """Chunk every .txt file in folder_path not yet in output_csv and append the chunks."""
     existing_files = set()
+    # An empty file (e.g. left by an interrupted first run) has no header to read
+    has_rows = os.path.exists(output_csv) and os.path.getsize(output_csv) > 0
 
-    if os.path.exists(output_csv):
-        existing_df = pd.read_csv(output_csv)
+    if has_rows:
+        # Only the names are needed to skip files; the chunk text stays on disk.
+        # Use pyarrow's multithreaded reader when it is installed.
+        try:
+            existing_df = pd.read_csv(output_csv, usecols=["document_name"], engine="pyarrow")
+        except ImportError:
+            existing_df = pd.read_csv(output_csv, usecols=["document_name"])
         existing_files = set(existing_df["document_name"].unique())
+
+    new_files = _new_txt_files(folder_path, existing_files)
+
+    # Append only the new rows instead of rewriting the whole archive, writing
+    # each file's chunks as soon as they arrive so only one file is held in memory.
+    # The file is opened on the first chunk, so a run with nothing new leaves it alone.
+    added = 0
+    output = None
+    try:
+        for document_name, chunks in _chunk_files(new_files, max_workers):
+            if not chunks:
+                continue
+            if output is None:
+                output = open(output_csv, "a", newline="", encoding="utf-8")
+                # Same dialect and line ending as the DataFrame.to_csv that wrote earlier rows
+                writer = csv.writer(output, lineterminator=os.linesep)
+                if not has_rows:
+                    writer.writerow(["document_name", "chunk_number", "chunk_text"])
+            writer.writerows(zip(repeat(document_name), range(1, len(chunks) + 1), chunks))
+            added += len(chunks)
+    finally:
+        if output is not None:
+            output.close()
+
+    if added:
+        print(f"Added {added} new chunks.")
     else:
-        existing_df = pd.DataFrame()
+        print("No new files to process.")
 
-    all_chunks = []
 
-    for file in Path(folder_path).glob("*.txt"):
-        if file.name not in existing_files:
-            print(f"Processing new file: {file.name}")
-            chunks = split_cleaned_text_to_chunks(str(file))
-            all_chunks.extend(chunks)
-        else:
-            print(f"Skipping existing file: {file.name}")
+def process_txt_folder_to_parquet(folder_path: str, output_dir: str, max_workers=None):
+    """Like process_txt_folder, but write a Parquet dataset partitioned by document_name.
+
+    Each source file gets its own partition directory, so the processed files
+    are known from a directory listing and a run only ever writes its new files.
+    Requires pyarrow.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    os.makedirs(output_dir, exist_ok=True)
+    # Hive-style partitions are named document_name=<URI-encoded name>
+    existing_files = {
+        unquote(name.partition("=")[2])
+        for name in os.listdir(output_dir)
+        if name.startswith("document_name=")
+    }
+
+    new_files = _new_txt_files(folder_path, existing_files)
+
+    added = 0
+    for document_name, chunks in _chunk_files(new_files, max_workers):
+        if not chunks:
+            continue
+        table = pa.Table.from_pydict({
+            "document_name": [document_name] * len(chunks),
+            "chunk_number": list(range(1, len(chunks) + 1)),
+            "chunk_text": chunks,
+        })
+        pq.write_to_dataset(table, root_path=output_dir, partition_cols=["document_name"])
+        added += len(chunks)
 
-    if all_chunks:
-        new_df = pd.DataFrame(all_chunks)
-        final_df = pd.concat([existing_df, new_df], ignore_index=True)
-        final_df.to_csv(output_csv, index=False, encoding="utf-8")
-        print(f"Added {len(new_df)} new chunks.")
+    if added:
+        print(f"Added {added} new chunks.")
     else:
         print("No new files to process.")
 
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import shutil
 from pathlib import Path
@@ -10,33 +11,58 @@ output_dir = Path("/Users/user/programming/manifestos_and_identity/2c_checked_an
 output_dir.mkdir(parents=True, exist_ok=True)
 
 # Load the comparison summary
-csv_path = "/Users/user/programming/manifestos_and_identity/2b_cleaned_text_files/comparison_summary.csv"  # Update if running locally
-df = pd.read_csv(csv_path)
+summary_csv = "/Users/user/programming/manifestos_and_identity/2b_cleaned_text_files/comparison_summary.csv"  # Update if running locally
+df = pd.read_csv(summary_csv, usecols=["group", "recommendation"])
+
+# List the input folder once instead of stat-ing up to two paths per row
+with os.scandir(input_dir) as entries:
+    input_names = [entry.name for entry in entries]
+
+
+def is_case_insensitive(directory, names):
+    """True if directory's filesystem ignores case in names (the macOS default)."""
+    for name in names:
+        swapped = name.swapcase()
+        if swapped != name:
+            try:
+                return os.path.samefile(os.path.join(directory, name), os.path.join(directory, swapped))
+            except OSError:
+                return False
+    return False
+
+
+# exists() matched names regardless of case on case-insensitive filesystems
+# (so a 'PyMuPDF' recommendation found '..._pymupdf_extraction.txt'); match the same way
+if is_case_insensitive(input_dir, input_names):
+    fold_name = str.lower
+else:
+    fold_name = str
+available_names = {fold_name(name) for name in input_names}
+
+# Plain strings for the loop, so each row joins paths without building Path objects
+in_dir = str(input_dir)
+out_dir = str(output_dir)
 
 # Process each row
-for idx, row in df.iterrows():
-    base_name = row['group']  # This column should hold the yyyy_mm_partyname string
-    recommended_method = row['recommendation']  # e.g. 'tesseract', 'pymupdf', etc.
+# base_name holds the yyyy_mm_partyname string, recommended_method e.g. 'tesseract', 'pymupdf'
+for base_name, recommended_method in zip(df["group"].to_numpy(), df["recommendation"].to_numpy()):
 
     # Check for _from_csv file
-    csv_filename = f"{base_name}_from_csv.txt"
-    csv_path = input_dir / csv_filename
+    from_csv_name = f"{base_name}_from_csv.txt"
 
-    if csv_path.exists():
-        selected_file = csv_path
+    if fold_name(from_csv_name) in available_names:
+        selected_name = from_csv_name
     else:
         # If no _from_csv, use recommended method
-        recommended_filename = f"{base_name}_{recommended_method}_extraction.txt"
-        recommended_path = input_dir / recommended_filename
-        if recommended_path.exists():
-            selected_file = recommended_path
+        recommended_name = f"{base_name}_{recommended_method}_extraction.txt"
+        if fold_name(recommended_name) in available_names:
+            selected_name = recommended_name
         else:
             print(f"Skipping {base_name}: No _from_csv or recommended file found.")
             continue
 
-    # Copy the selected file
-    dest_path = output_dir / selected_file.name
-    shutil.copy(selected_file, dest_path)
-    print(f"Copied: {selected_file.name}")
+    # Copy the selected file (contents only; copyfile uses the OS's in-kernel copy)
+    shutil.copyfile(os.path.join(in_dir, selected_name), os.path.join(out_dir, selected_name))
+    print(f"Copied: {selected_name}")
 
 print("File transfer complete.")
\ No newline at end of file